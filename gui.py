@@ -1,11 +1,39 @@
 # gui.py
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, time
 import os
 from typing import Optional, Callable
 
 from models import CallSheet, Location, CastMember, CrewMember
+# Aliased so the functions don't shadow the CallSheetApp methods of the
+# same names; importing here removes the per-click import from the callbacks
+from data_manager import save_call_sheet as _save_call_sheet_file
+from data_manager import load_call_sheet as _load_call_sheet_file
+
+def _set_if_diff(var: tk.Variable, value) -> None:
+    """Set a Tk variable only when the value actually changed"""
+    # Skipping no-op sets avoids Tcl variable writes and trace callbacks
+    try:
+        if var.get() == value:
+            return
+    except tk.TclError:
+        # The current contents can't be read (e.g. blanked IntVar field)
+        pass
+    var.set(value)
+
+def _set_text_if_diff(widget: tk.Text, value: str) -> None:
+    """Replace a Text widget's contents only when they actually changed"""
+    if widget.get("1.0", tk.END).rstrip("\n") != value:
+        widget.delete("1.0", tk.END)
+        if value:
+            widget.insert("1.0", value)
+
+# Crew lists longer than _VIRTUAL_ROWS render through a sliding window of
+# _VIRTUAL_WINDOW materialized treeview rows instead of inserting every row
+_VIRTUAL_ROWS = 200
+_VIRTUAL_WINDOW = 100
 
 class TimeInput(ttk.Frame):
     """Custom widget for time input"""
@@ -58,29 +86,101 @@ class CallSheetApp(tk.Tk):
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Create tab frames
-        self.production_frame = ProductionInfoFrame(self.notebook, self.call_sheet)
-        self.locations_frame = LocationsFrame(self.notebook, self.call_sheet)
-        self.cast_frame = CastFrame(self.notebook, self.call_sheet)
-        self.crew_frame = CrewFrame(self.notebook, self.call_sheet)
-        
-        # Add tabs to notebook
-        self.notebook.add(self.production_frame, text="Production Info")
-        self.notebook.add(self.locations_frame, text="Locations")
-        self.notebook.add(self.cast_frame, text="Cast")
-        self.notebook.add(self.crew_frame, text="Crew")
-        
+
+        # Tabs are built lazily: placeholders keep startup from paying for
+        # four widget trees when only one tab is visible; the real frame is
+        # swapped in on first visit
+        self._tab_specs = [
+            ("Production Info", ProductionInfoFrame),
+            ("Locations", LocationsFrame),
+            ("Cast", CastFrame),
+            ("Crew", CrewFrame),
+        ]
+        self._tab_frames = [None] * len(self._tab_specs)
+        for title, _ in self._tab_specs:
+            self.notebook.add(ttk.Frame(self.notebook), text=title)
+
+        # Build the default tab synchronously so the first paint is correct
+        self._build_tab(0)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
         # Create buttons frame
         self.buttons_frame = ttk.Frame(self)
         self.buttons_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        # Add buttons
+        # Add buttons; save/load are kept as attributes so they can be
+        # disabled while background IO is in flight
         ttk.Button(self.buttons_frame, text="New Call Sheet", command=self.new_call_sheet).pack(side=tk.LEFT, padx=5)
-        ttk.Button(self.buttons_frame, text="Save", command=self.save_call_sheet).pack(side=tk.LEFT, padx=5)
-        ttk.Button(self.buttons_frame, text="Load", command=self.load_call_sheet).pack(side=tk.LEFT, padx=5)
+        self.save_button = ttk.Button(self.buttons_frame, text="Save", command=self.save_call_sheet)
+        self.save_button.pack(side=tk.LEFT, padx=5)
+        self.load_button = ttk.Button(self.buttons_frame, text="Load", command=self.load_call_sheet)
+        self.load_button.pack(side=tk.LEFT, padx=5)
         ttk.Button(self.buttons_frame, text="Generate PDF", command=self.generate_pdf).pack(side=tk.RIGHT, padx=5)
-    
+
+        # Single worker for file IO so saves/loads never block the Tk
+        # event loop; one worker also serializes writes
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+
+        # Non-modal status bar for transient success messages; the modal
+        # showinfo popups stalled the event loop until dismissed
+        self.status_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.status_var, anchor="w").pack(fill=tk.X, side=tk.BOTTOM, padx=10)
+        self._status_after_id = None
+
+    def set_status(self, message: str) -> None:
+        """Show a transient message in the status bar"""
+        if self._status_after_id:
+            self.after_cancel(self._status_after_id)
+        self.status_var.set(message)
+        self._status_after_id = self.after(3000, self._clear_status)
+
+    def _clear_status(self) -> None:
+        """Clear the status bar message"""
+        self._status_after_id = None
+        self.status_var.set("")
+
+    def _build_tab(self, index: int) -> ttk.Frame:
+        """Build the real frame for a tab, replacing its placeholder"""
+        if self._tab_frames[index] is None:
+            title, frame_class = self._tab_specs[index]
+            frame = frame_class(self.notebook, self.call_sheet)
+            # Forgetting the selected placeholder moves the selection, so
+            # restore it only in that case; property-driven builds (load,
+            # new, PDF generation touch every frame) must not yank the view
+            # to whichever tab happened to build last
+            reselect = self.notebook.index("current") == index
+            self.notebook.forget(index)
+            # With the placeholder forgotten, the last slot equals the tab
+            # count and Tk only accepts "end" for that position
+            pos = "end" if index == self.notebook.index("end") else index
+            self.notebook.insert(pos, frame, text=title)
+            if reselect:
+                self.notebook.select(index)
+            self._tab_frames[index] = frame
+        return self._tab_frames[index]
+
+    def _on_tab_changed(self, event) -> None:
+        """Build a tab's contents the first time it is selected"""
+        self._build_tab(self.notebook.index("current"))
+
+    # Tab frames are exposed as properties so external callers (main.py
+    # wires PDF generation through them) force construction on demand
+    @property
+    def production_frame(self) -> "ProductionInfoFrame":
+        return self._build_tab(0)
+
+    @property
+    def locations_frame(self) -> "LocationsFrame":
+        return self._build_tab(1)
+
+    @property
+    def cast_frame(self) -> "CastFrame":
+        return self._build_tab(2)
+
+    @property
+    def crew_frame(self) -> "CrewFrame":
+        return self._build_tab(3)
+
     def new_call_sheet(self) -> None:
         """Create a new call sheet"""
         # Ask for confirmation if current sheet has data
@@ -101,7 +201,7 @@ class CallSheetApp(tk.Tk):
         self.cast_frame.update_list()
         self.crew_frame.update_list()
         
-        messagebox.showinfo("New Call Sheet", "New call sheet created.")
+        self.set_status("New call sheet created.")
     
     def save_call_sheet(self) -> None:
         """Save call sheet to file"""
@@ -124,13 +224,21 @@ class CallSheetApp(tk.Tk):
         if not filename:
             return
         
-        # Save call sheet
-        from data_manager import save_call_sheet
-        if save_call_sheet(self.call_sheet, os.path.basename(filename)):
-            messagebox.showinfo("Save Call Sheet", "Call sheet saved successfully.")
+        # Save call sheet on the worker thread; disable the button so the
+        # user can't queue overlapping writes
+        self.save_button.configure(state="disabled")
+        future = self._io_executor.submit(
+            _save_call_sheet_file, self.call_sheet, os.path.basename(filename))
+        future.add_done_callback(lambda f: self.after(0, self._on_save_done, f))
+
+    def _on_save_done(self, future) -> None:
+        """Handle a finished background save on the Tk thread"""
+        self.save_button.configure(state="normal")
+        if future.result():
+            self.set_status("Call sheet saved successfully.")
         else:
             messagebox.showerror("Save Error", "Failed to save call sheet.")
-    
+
     def load_call_sheet(self) -> None:
         """Load call sheet from file"""
         # Ask for confirmation if current sheet has data
@@ -147,20 +255,26 @@ class CallSheetApp(tk.Tk):
         if not filename:
             return
         
-        # Load call sheet
-        from data_manager import load_call_sheet
-        call_sheet = load_call_sheet(os.path.basename(filename))
-        
+        # Load call sheet on the worker thread
+        self.load_button.configure(state="disabled")
+        future = self._io_executor.submit(_load_call_sheet_file, os.path.basename(filename))
+        future.add_done_callback(lambda f: self.after(0, self._on_load_done, f))
+
+    def _on_load_done(self, future) -> None:
+        """Handle a finished background load on the Tk thread"""
+        self.load_button.configure(state="normal")
+        call_sheet = future.result()
+
         if call_sheet:
             self.call_sheet = call_sheet
-            
+
             # Update tabs
             self.production_frame.update_fields()
             self.locations_frame.update_fields()
             self.cast_frame.update_list()
             self.crew_frame.update_list()
-            
-            messagebox.showinfo("Load Call Sheet", "Call sheet loaded successfully.")
+
+            self.set_status("Call sheet loaded successfully.")
         else:
             messagebox.showerror("Load Error", "Failed to load call sheet.")
     
@@ -207,16 +321,24 @@ class ProductionInfoFrame(ttk.Frame):
         self.date_frame = ttk.Frame(self)
         self.date_frame.grid(row=2, column=1, padx=5, pady=5, sticky="w")
         
-        # Month, day, year dropdowns
-        self.month_var = tk.StringVar()
-        self.day_var = tk.StringVar()
-        self.year_var = tk.StringVar()
-        
-        ttk.Combobox(self.date_frame, textvariable=self.month_var, values=list(range(1, 13)), width=3).pack(side=tk.LEFT, padx=(0, 5))
+        # Month, day, year spinboxes; IntVars avoid the string round-trip
+        # that Comboboxes backed by StringVars force on every read/write
+        self.month_var = tk.IntVar()
+        self.day_var = tk.IntVar()
+        self.year_var = tk.IntVar()
+
+        # Reject non-digit keystrokes at the edge so the save path can
+        # trust the fields instead of parsing defensively
+        vcmd = (self.register(self._validate_int), "%P")
+
+        ttk.Spinbox(self.date_frame, from_=1, to=12, textvariable=self.month_var, width=3,
+                    validate="key", validatecommand=vcmd).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(self.date_frame, text="/").pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Combobox(self.date_frame, textvariable=self.day_var, values=list(range(1, 32)), width=3).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Spinbox(self.date_frame, from_=1, to=31, textvariable=self.day_var, width=3,
+                    validate="key", validatecommand=vcmd).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Label(self.date_frame, text="/").pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Combobox(self.date_frame, textvariable=self.year_var, values=list(range(2023, 2031)), width=5).pack(side=tk.LEFT)
+        ttk.Spinbox(self.date_frame, from_=2023, to=2030, textvariable=self.year_var, width=5,
+                    validate="key", validatecommand=vcmd).pack(side=tk.LEFT)
         
         # General call time
         ttk.Label(self, text="General Call Time:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
@@ -239,38 +361,47 @@ class ProductionInfoFrame(ttk.Frame):
         
         # Update fields with call sheet data
         self.update_fields()
-    
+
+    @staticmethod
+    def _validate_int(proposed: str) -> bool:
+        """Allow only empty or all-digit date field contents"""
+        return proposed == "" or proposed.isdigit()
+
     def update_fields(self) -> None:
         """Update fields with call sheet data"""
-        self.production_name_var.set(self.call_sheet.production_name)
-        
+        _set_if_diff(self.production_name_var, self.call_sheet.production_name)
+
         # Set date values
-        self.month_var.set(self.call_sheet.production_date.month)
-        self.day_var.set(self.call_sheet.production_date.day)
-        self.year_var.set(self.call_sheet.production_date.year)
-        
+        _set_if_diff(self.month_var, self.call_sheet.production_date.month)
+        _set_if_diff(self.day_var, self.call_sheet.production_date.day)
+        _set_if_diff(self.year_var, self.call_sheet.production_date.year)
+
         # Set call time
         self.call_time_input.set_time(self.call_sheet.general_call_time)
-        
+
         # Set logo path
-        self.logo_path_var.set(self.call_sheet.logo_path or "")
-        
+        _set_if_diff(self.logo_path_var, self.call_sheet.logo_path or "")
+
         # Set notes
-        self.notes_text.delete("1.0", tk.END)
-        if self.call_sheet.notes:
-            self.notes_text.insert("1.0", self.call_sheet.notes)
+        _set_text_if_diff(self.notes_text, self.call_sheet.notes or "")
     
     def save_to_call_sheet(self) -> None:
         """Save field values to call sheet"""
         self.call_sheet.production_name = self.production_name_var.get()
         
-        # Get date from fields
+        # Get date from fields; keystroke validation guarantees digits, so
+        # only an emptied field (TclError) or an impossible calendar date
+        # (ValueError from datetime) can fail here
         try:
-            month = int(self.month_var.get())
-            day = int(self.day_var.get())
-            year = int(self.year_var.get())
-            self.call_sheet.production_date = datetime(year, month, day)
-        except (ValueError, TypeError):
+            month = self.month_var.get()
+            day = self.day_var.get()
+            year = self.year_var.get()
+
+            # Skip rebuilding the datetime when the date didn't change
+            current = self.call_sheet.production_date
+            if (year, month, day) != (current.year, current.month, current.day):
+                self.call_sheet.production_date = datetime(year, month, day)
+        except (tk.TclError, ValueError):
             messagebox.showerror("Date Error", "Invalid date.")
         
         # Get call time
@@ -299,100 +430,168 @@ class LocationsFrame(ttk.Frame):
     def __init__(self, parent, call_sheet: CallSheet):
         super().__init__(parent)
         self.call_sheet = call_sheet
-        
-        # Create and place widgets
-        ttk.Label(self, text="Filming Locations", font=("TkDefaultFont", 14, "bold")).grid(row=0, column=0, columnspan=2, pady=(10, 20), sticky="w")
-        
+
+        # Pre-declare column sizing, then create every widget first and
+        # apply all grid placements in one pass at the end, so Tk runs a
+        # single layout negotiation instead of one per grid() call
+        self.columnconfigure(1, weight=1)
+        to_grid = []
+
+        # Create widgets
+        to_grid.append((ttk.Label(self, text="Filming Locations", font=("TkDefaultFont", 14, "bold")),
+                        dict(row=0, column=0, columnspan=2, pady=(10, 20), sticky="w")))
+
         # Home base
-        ttk.Label(self, text="Home Base", font=("TkDefaultFont", 12, "bold")).grid(row=1, column=0, columnspan=2, pady=(10, 5), sticky="w")
-        
+        to_grid.append((ttk.Label(self, text="Home Base", font=("TkDefaultFont", 12, "bold")),
+                        dict(row=1, column=0, columnspan=2, pady=(10, 5), sticky="w")))
+
         # Home base name
-        ttk.Label(self, text="Name:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        to_grid.append((ttk.Label(self, text="Name:"),
+                        dict(row=2, column=0, padx=5, pady=5, sticky="w")))
         self.home_base_name_var = tk.StringVar()
-        ttk.Entry(self, textvariable=self.home_base_name_var, width=40).grid(row=2, column=1, padx=5, pady=5, sticky="w")
-        
+        to_grid.append((ttk.Entry(self, textvariable=self.home_base_name_var, width=40),
+                        dict(row=2, column=1, padx=5, pady=5, sticky="w")))
+
         # Home base address
-        ttk.Label(self, text="Address:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        to_grid.append((ttk.Label(self, text="Address:"),
+                        dict(row=3, column=0, padx=5, pady=5, sticky="w")))
         self.home_base_address_var = tk.StringVar()
-        ttk.Entry(self, textvariable=self.home_base_address_var, width=40).grid(row=3, column=1, padx=5, pady=5, sticky="w")
-        
+        to_grid.append((ttk.Entry(self, textvariable=self.home_base_address_var, width=40),
+                        dict(row=3, column=1, padx=5, pady=5, sticky="w")))
+
         # Home base notes
-        ttk.Label(self, text="Notes:").grid(row=4, column=0, padx=5, pady=5, sticky="nw")
+        to_grid.append((ttk.Label(self, text="Notes:"),
+                        dict(row=4, column=0, padx=5, pady=5, sticky="nw")))
         self.home_base_notes_text = tk.Text(self, width=40, height=3)
-        self.home_base_notes_text.grid(row=4, column=1, padx=5, pady=5, sticky="w")
-        
+        to_grid.append((self.home_base_notes_text,
+                        dict(row=4, column=1, padx=5, pady=5, sticky="w")))
+
         # Filming locations
-        ttk.Label(self, text="Filming Locations (max. 3)", font=("TkDefaultFont", 12, "bold")).grid(row=5, column=0, columnspan=2, pady=(20, 5), sticky="w")
-        
-        # Filming locations notebook
-        self.locations_notebook = ttk.Notebook(self)
-        self.locations_notebook.grid(row=6, column=0, columnspan=2, padx=5, pady=5, sticky="nsew")
-        
-        # Create location frames
-        self.location_frames = []
-        for i in range(3):
-            frame = ttk.Frame(self.locations_notebook)
-            self.locations_notebook.add(frame, text=f"Location {i+1}")
-            
-            # Name
-            ttk.Label(frame, text="Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
-            name_var = tk.StringVar()
-            ttk.Entry(frame, textvariable=name_var, width=40).grid(row=0, column=1, padx=5, pady=5, sticky="w")
-            
-            # Address
-            ttk.Label(frame, text="Address:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
-            address_var = tk.StringVar()
-            ttk.Entry(frame, textvariable=address_var, width=40).grid(row=1, column=1, padx=5, pady=5, sticky="w")
-            
-            # Notes
-            ttk.Label(frame, text="Notes:").grid(row=2, column=0, padx=5, pady=5, sticky="nw")
-            notes_text = tk.Text(frame, width=40, height=3)
-            notes_text.grid(row=2, column=1, padx=5, pady=5, sticky="w")
-            
-            self.location_frames.append({
-                "frame": frame,
-                "name_var": name_var,
-                "address_var": address_var,
-                "notes_text": notes_text
-            })
-        
+        to_grid.append((ttk.Label(self, text="Filming Locations (max. 3)", font=("TkDefaultFont", 12, "bold")),
+                        dict(row=5, column=0, columnspan=2, pady=(20, 5), sticky="w")))
+
+        # One listbox plus a single shared edit panel, instead of a notebook
+        # with a full set of entry widgets per location: a third of the
+        # widgets, and only the selected slot is ever rendered
+        self.loc_listbox = tk.Listbox(self, height=3, exportselection=False)
+        to_grid.append((self.loc_listbox,
+                        dict(row=6, column=0, columnspan=2, padx=5, pady=5, sticky="ew")))
+        self.loc_listbox.bind("<<ListboxSelect>>", self._on_loc_select)
+
+        # Plain per-slot dicts back the listbox; the panel widgets are
+        # flushed into the selected slot before another one is shown
+        self._loc_slots = [{"name": "", "address": "", "notes": ""} for _ in range(3)]
+        self._loc_selected = 0
+        self._loc_select_after_id = None
+
+        panel = ttk.Frame(self)
+        to_grid.append((panel,
+                        dict(row=7, column=0, columnspan=2, padx=5, pady=5, sticky="ew")))
+
+        to_grid.append((ttk.Label(panel, text="Name:"),
+                        dict(row=0, column=0, padx=5, pady=5, sticky="w")))
+        self.loc_name_var = tk.StringVar()
+        to_grid.append((ttk.Entry(panel, textvariable=self.loc_name_var, width=40),
+                        dict(row=0, column=1, padx=5, pady=5, sticky="w")))
+
+        to_grid.append((ttk.Label(panel, text="Address:"),
+                        dict(row=1, column=0, padx=5, pady=5, sticky="w")))
+        self.loc_address_var = tk.StringVar()
+        to_grid.append((ttk.Entry(panel, textvariable=self.loc_address_var, width=40),
+                        dict(row=1, column=1, padx=5, pady=5, sticky="w")))
+
+        to_grid.append((ttk.Label(panel, text="Notes:"),
+                        dict(row=2, column=0, padx=5, pady=5, sticky="nw")))
+        self.loc_notes_text = tk.Text(panel, width=40, height=3)
+        to_grid.append((self.loc_notes_text,
+                        dict(row=2, column=1, padx=5, pady=5, sticky="w")))
+
+        # Place everything in one pass
+        for widget, opts in to_grid:
+            widget.grid(**opts)
+
+        self._refresh_loc_listbox()
+        self.loc_listbox.selection_set(0)
+
         # Update fields with call sheet data
         self.update_fields()
-    
+
+    def _refresh_loc_listbox(self) -> None:
+        """Rebuild the listbox labels from the location slots"""
+        selected = self._loc_selected
+        self.loc_listbox.delete(0, tk.END)
+        for i, slot in enumerate(self._loc_slots):
+            label = f"Location {i+1}"
+            if slot["name"]:
+                label += f": {slot['name']}"
+            self.loc_listbox.insert(tk.END, label)
+        self.loc_listbox.selection_set(selected)
+
+    def _flush_loc_panel(self) -> None:
+        """Save the edit panel contents into the selected slot"""
+        slot = self._loc_slots[self._loc_selected]
+        slot["name"] = self.loc_name_var.get()
+        slot["address"] = self.loc_address_var.get()
+        slot["notes"] = self.loc_notes_text.get("1.0", tk.END).strip()
+
+    def _load_loc_panel(self, index: int) -> None:
+        """Show the given slot in the edit panel"""
+        self._loc_selected = index
+        slot = self._loc_slots[index]
+        _set_if_diff(self.loc_name_var, slot["name"])
+        _set_if_diff(self.loc_address_var, slot["address"])
+        _set_text_if_diff(self.loc_notes_text, slot["notes"])
+
+    def _on_loc_select(self, event=None) -> None:
+        """Swap the edit panel to the newly-selected location, debounced"""
+        # Collapse rapid selection changes into one panel swap, as with the
+        # crew filter debounce
+        if self._loc_select_after_id is not None:
+            self.after_cancel(self._loc_select_after_id)
+        self._loc_select_after_id = self.after(50, self._do_loc_select)
+
+    def _do_loc_select(self) -> None:
+        """Apply the pending listbox selection to the edit panel"""
+        self._loc_select_after_id = None
+        selection = self.loc_listbox.curselection()
+        if not selection or selection[0] == self._loc_selected:
+            return
+        self._flush_loc_panel()
+        self._refresh_loc_listbox()
+        self._load_loc_panel(selection[0])
+        self.loc_listbox.selection_clear(0, tk.END)
+        self.loc_listbox.selection_set(selection[0])
+
     def update_fields(self) -> None:
         """Update fields with call sheet data"""
         # Set home base values
-        if self.call_sheet.home_base:
-            self.home_base_name_var.set(self.call_sheet.home_base.name)
-            self.home_base_address_var.set(self.call_sheet.home_base.address)
-            self.home_base_notes_text.delete("1.0", tk.END)
-            if self.call_sheet.home_base.notes:
-                self.home_base_notes_text.insert("1.0", self.call_sheet.home_base.notes)
-        else:
-            self.home_base_name_var.set("")
-            self.home_base_address_var.set("")
-            self.home_base_notes_text.delete("1.0", tk.END)
-        
-        # Set filming location values
-        for i, location_frame in enumerate(self.location_frames):
-            if i < len(self.call_sheet.filming_locations):
-                location = self.call_sheet.filming_locations[i]
-                location_frame["name_var"].set(location.name)
-                location_frame["address_var"].set(location.address)
-                location_frame["notes_text"].delete("1.0", tk.END)
-                if location.notes:
-                    location_frame["notes_text"].insert("1.0", location.notes)
+        home_base = self.call_sheet.home_base
+        _set_if_diff(self.home_base_name_var, home_base.name if home_base else "")
+        _set_if_diff(self.home_base_address_var, home_base.address if home_base else "")
+        _set_text_if_diff(self.home_base_notes_text,
+                          home_base.notes or "" if home_base else "")
+
+        # Fill the location slots; only the selected one touches widgets
+        locations = self.call_sheet.filming_locations
+        for i, slot in enumerate(self._loc_slots):
+            if i < len(locations):
+                location = locations[i]
+                slot["name"] = location.name
+                slot["address"] = location.address
+                slot["notes"] = location.notes or ""
             else:
-                location_frame["name_var"].set("")
-                location_frame["address_var"].set("")
-                location_frame["notes_text"].delete("1.0", tk.END)
-    
+                slot["name"] = ""
+                slot["address"] = ""
+                slot["notes"] = ""
+        self._refresh_loc_listbox()
+        self._load_loc_panel(self._loc_selected)
+
     def save_to_call_sheet(self) -> None:
         """Save field values to call sheet"""
         # Save home base
         home_base_name = self.home_base_name_var.get()
         home_base_address = self.home_base_address_var.get()
-        
+
         if home_base_name and home_base_address:
             home_base_notes = self.home_base_notes_text.get("1.0", tk.END).strip()
             self.call_sheet.home_base = Location(
@@ -402,20 +601,20 @@ class LocationsFrame(ttk.Frame):
             )
         else:
             self.call_sheet.home_base = None
-        
-        # Save filming locations
+
+        # Save filming locations: pick up any pending panel edits first
+        self._flush_loc_panel()
         self.call_sheet.filming_locations = []
-        
-        for location_frame in self.location_frames:
-            name = location_frame["name_var"].get()
-            address = location_frame["address_var"].get()
-            
+
+        for slot in self._loc_slots:
+            name = slot["name"]
+            address = slot["address"]
+
             if name and address:
-                notes = location_frame["notes_text"].get("1.0", tk.END).strip()
                 self.call_sheet.add_filming_location(Location(
                     name=name,
                     address=address,
-                    notes=notes if notes else None
+                    notes=slot["notes"] if slot["notes"] else None
                 ))
 
 class CastFrame(ttk.Frame):
@@ -456,44 +655,96 @@ class CastFrame(ttk.Frame):
         ttk.Button(self.cast_button_frame, text="Add", command=self.add_cast_member).pack(side=tk.LEFT, padx=5)
         ttk.Button(self.cast_button_frame, text="Edit", command=self.edit_cast_member).pack(side=tk.LEFT, padx=5)
         ttk.Button(self.cast_button_frame, text="Remove", command=self.remove_cast_member).pack(side=tk.LEFT, padx=5)
-        
+
+        # Last-rendered treeview rows keyed by iid, for diff-based updates
+        self._rendered = {}
+
+        # Shared add/edit dialog, built once on first use and then reused
+        self._dialog = None
+
         # Update cast list
         self.update_list()
-    
+
     def update_list(self) -> None:
         """Update cast list with call sheet data"""
-        # Clear treeview
-        for item in self.cast_tree.get_children():
-            self.cast_tree.delete(item)
-        
-        # Add cast members
-        for cast_member in self.call_sheet.cast_members:
-            self.cast_tree.insert("", tk.END, values=(
-                cast_member.name,
-                cast_member.role,
-                cast_member.call_time.strftime("%H:%M")
-            ))
+        tree = self.cast_tree
+        rendered = self._rendered
+
+        # Build the target rows keyed by a stable per-object iid; dicts
+        # preserve insertion order, so this also records the row order
+        new_rows = {
+            str(id(cast)): (cast.name, cast.role, cast.call_time_str)
+            for cast in self.call_sheet.cast_members
+        }
+
+        # Work out the scale of the change up front
+        to_delete = [iid for iid in rendered if iid not in new_rows]
+        order_changed = ([iid for iid in rendered if iid in new_rows] !=
+                         [iid for iid in new_rows if iid in rendered])
+        n_inserts = (len(new_rows) if order_changed
+                     else sum(1 for iid in new_rows if iid not in rendered))
+
+        # Freeze drawing during bulk mutation (Tk's closest equivalent of a
+        # Freeze/Thaw pair) so the widget repaints once instead of per row
+        bulk = len(to_delete) + n_inserts > 10
+        if bulk:
+            tree.configure(show="")
+        try:
+            # Hoist the bound methods so the row loops run on local
+            # variables instead of repeated attribute lookups
+            delete = tree.delete
+            insert = tree.insert
+            item = tree.item
+
+            # Remove rows whose objects are gone
+            for iid in to_delete:
+                delete(iid)
+                del rendered[iid]
+
+            # If surviving rows changed relative order, rebuild from scratch
+            if order_changed:
+                delete(*tree.get_children())
+                rendered.clear()
+
+            # Insert new rows and rewrite only rows whose values changed, so
+            # an add or edit costs O(1) Tcl calls instead of an O(N) rebuild
+            for index, (iid, values) in enumerate(new_rows.items()):
+                if iid not in rendered:
+                    insert("", index, iid=iid, values=values)
+                elif rendered[iid] != values:
+                    item(iid, values=values)
+        finally:
+            if bulk:
+                tree.configure(show="headings")
+
+        self._rendered = new_rows
     
+    def _get_dialog(self) -> "CastMemberDialog":
+        """Create the shared add/edit dialog on first use"""
+        if self._dialog is None:
+            self._dialog = CastMemberDialog(self)
+        return self._dialog
+
     def add_cast_member(self) -> None:
         """Add a new cast member"""
-        dialog = CastMemberDialog(self, "Add Cast Member")
-        if dialog.result:
-            self.call_sheet.add_cast_member(dialog.result)
+        result = self._get_dialog().show("Add Cast Member")
+        if result:
+            self.call_sheet.add_cast_member(result)
             self.update_list()
-    
+
     def edit_cast_member(self) -> None:
         """Edit selected cast member"""
         selected_item = self.cast_tree.selection()
         if not selected_item:
             messagebox.showerror("Edit Error", "No cast member selected.")
             return
-        
+
         selected_index = self.cast_tree.index(selected_item[0])
         if selected_index >= 0 and selected_index < len(self.call_sheet.cast_members):
             cast_member = self.call_sheet.cast_members[selected_index]
-            dialog = CastMemberDialog(self, "Edit Cast Member", cast_member)
-            if dialog.result:
-                self.call_sheet.cast_members[selected_index] = dialog.result
+            result = self._get_dialog().show("Edit Cast Member", cast_member)
+            if result:
+                self.call_sheet.cast_members[selected_index] = result
                 self.update_list()
     
     def remove_cast_member(self) -> None:
@@ -510,18 +761,20 @@ class CastFrame(ttk.Frame):
                 self.update_list()
 
 class CastMemberDialog(tk.Toplevel):
-    """Dialog for adding/editing cast members"""
-    def __init__(self, parent, title, cast_member: Optional[CastMember] = None):
+    """Dialog for adding/editing cast members, built once and reused"""
+    def __init__(self, parent):
         super().__init__(parent)
-        
+
+        # Stay unmapped while widgets are built so the dialog appears once,
+        # already positioned, instead of popping up and then jumping
+        self.withdraw()
+
         self.result = None
-        
+
         # Set dialog properties
-        self.title(title)
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
-        
+
         # Create and place widgets
         ttk.Label(self, text="Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.name_var = tk.StringVar()
@@ -543,52 +796,78 @@ class CastMemberDialog(tk.Toplevel):
         button_frame = ttk.Frame(self)
         button_frame.grid(row=4, column=0, columnspan=2, pady=10)
         
-        ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="OK", command=self.save).pack(side=tk.LEFT, padx=5)
-        
-        # Set initial values if editing
-        if cast_member:
-            self.name_var.set(cast_member.name)
-            self.role_var.set(cast_member.role)
-            self.call_time_input.set_time(cast_member.call_time)
-            if cast_member.notes:
-                self.notes_text.insert("1.0", cast_member.notes)
-        
-        # Center dialog
+
+        # Signals the modal wait in show() that the dialog was dismissed
+        self._done_var = tk.IntVar(self)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        # Center dialog once using the requested size; setting only the
+        # position lets Tk keep that size without a second layout pass
         self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        width = self.winfo_reqwidth()
+        height = self.winfo_reqheight()
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        
-        # Make dialog modal
-        self.wait_window(self)
-    
+        self.geometry(f"+{x}+{y}")
+
+    def show(self, title: str, cast_member: Optional[CastMember] = None) -> Optional[CastMember]:
+        """Show the dialog modally and return the entered member, or None"""
+        self.result = None
+        self.title(title)
+
+        # Reset or prefill the fields
+        self.name_var.set(cast_member.name if cast_member else "")
+        self.role_var.set(cast_member.role if cast_member else "")
+        self.call_time_input.set_time(
+            cast_member.call_time if cast_member else time(hour=8, minute=0))
+        self.notes_text.delete("1.0", tk.END)
+        if cast_member and cast_member.notes:
+            self.notes_text.insert("1.0", cast_member.notes)
+
+        # Reopening costs a deiconify instead of a widget-tree rebuild
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self._done_var)
+        return self.result
+
     def save(self) -> None:
         """Save dialog values and close"""
         name = self.name_var.get()
         role = self.role_var.get()
-        
+
         if not name:
             messagebox.showerror("Input Error", "Name is required.")
             return
-        
+
         if not role:
             messagebox.showerror("Input Error", "Role is required.")
             return
-        
+
         call_time = self.call_time_input.get_time()
-        notes = self.notes_text.get("1.0", tk.END).strip()
-        
+        # "end-1c" excludes the implicit trailing newline, so the common
+        # empty case needs no strip() at all
+        notes = self.notes_text.get("1.0", "end-1c")
+
         self.result = CastMember(
             name=name,
             role=role,
             call_time=call_time,
-            notes=notes if notes else None
+            notes=notes.strip() or None if notes else None
         )
-        
-        self.destroy()
+
+        self._dismiss()
+
+    def cancel(self) -> None:
+        """Close the dialog without a result"""
+        self._dismiss()
+
+    def _dismiss(self) -> None:
+        """Hide the dialog and release the modal wait"""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(self._done_var.get() + 1)
 
 class CrewFrame(ttk.Frame):
     """Frame for crew information"""
@@ -630,9 +909,12 @@ class CrewFrame(ttk.Frame):
         
         self.crew_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        scrollbar = ttk.Scrollbar(self.crew_tree_frame, orient=tk.VERTICAL, command=self.crew_tree.yview)
+        # Both scroll hooks go through proxies so a long crew list can be
+        # windowed: only ~_VIRTUAL_WINDOW rows exist in the widget at a time
+        scrollbar = ttk.Scrollbar(self.crew_tree_frame, orient=tk.VERTICAL, command=self._yview)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.crew_tree.configure(yscrollcommand=scrollbar.set)
+        self.crew_tree.configure(yscrollcommand=self._on_tree_yscroll)
+        self._vscrollbar = scrollbar
         
         # Button frame
         self.crew_button_frame = ttk.Frame(self)
@@ -641,7 +923,33 @@ class CrewFrame(ttk.Frame):
         ttk.Button(self.crew_button_frame, text="Add", command=self.add_crew_member).pack(side=tk.LEFT, padx=5)
         ttk.Button(self.crew_button_frame, text="Edit", command=self.edit_crew_member).pack(side=tk.LEFT, padx=5)
         ttk.Button(self.crew_button_frame, text="Remove", command=self.remove_crew_member).pack(side=tk.LEFT, padx=5)
-        
+
+        # Last-rendered treeview rows keyed by iid, for diff-based updates
+        self._rendered = {}
+
+        # Shared add/edit dialog, built once on first use and then reused
+        self._dialog = None
+
+        # Pending after() id for the debounced department filter, and the
+        # last department actually applied so re-selections are free
+        self._filter_after_id = None
+        self._last_filter = None
+
+        # Treeview iid -> index into call_sheet.crew_members, rebuilt by
+        # update_list so selections resolve without a linear scan
+        self._crew_index = {}
+
+        # Virtual-window state: the filtered list backing the treeview, the
+        # index of the first materialized row, and a reentrancy guard for
+        # window shifts triggered from inside the yscroll callback
+        self._visible_crew = []
+        self._win_first = 0
+        self._win_shifting = False
+
+        # Combobox values as last pushed to Tcl, kept as a Python list so
+        # updates can compare and append without rebuilding tuples
+        self._dept_list = ["All Departments"]
+
         # Update crew list and departments
         self.update_departments()
         self.update_list()
@@ -652,61 +960,207 @@ class CrewFrame(ttk.Frame):
     def update_departments(self) -> None:
         """Update department list"""
         departments = self.call_sheet.get_departments()
-        self.department_combobox["values"] = ["All Departments"] + departments
-        
+
+        # Skip the Tcl round-trip when the department set didn't change
+        new_list = ["All Departments"] + departments
+        if new_list != self._dept_list:
+            self._dept_list = new_list
+            self.department_combobox.configure(values=new_list)
+
+
         # Set to "All Departments" if not already set
         if not self.department_var.get() or self.department_var.get() not in departments:
             self.department_var.set("All Departments")
     
     def update_list(self) -> None:
         """Update crew list with call sheet data"""
-        # Clear treeview
-        for item in self.crew_tree.get_children():
-            self.crew_tree.delete(item)
-        
+        tree = self.crew_tree
+        rendered = self._rendered
+
         # Filter by department
         department = self.department_var.get()
+        self._last_filter = department
         crew_members = self.call_sheet.crew_members
-        
+
+        # Rebuild the iid -> list-index map over the full crew list so
+        # edit/remove resolve the selection in O(1) instead of scanning
+        self._crew_index = {str(id(crew)): i for i, crew in enumerate(crew_members)}
+
         if department != "All Departments":
-            crew_members = [crew for crew in crew_members if crew.department == department]
-        
-        # Add crew members
-        for crew_member in crew_members:
-            self.crew_tree.insert("", tk.END, values=(
-                crew_member.name,
-                crew_member.position,
-                crew_member.department,
-                crew_member.call_time.strftime("%H:%M")
-            ))
-    
+            crew_members = self.call_sheet.get_crew_by_department(department)
+
+        # Past the threshold, switch to windowed rendering: only a slice of
+        # rows is materialized and the scrollbar is driven manually
+        self._visible_crew = crew_members
+        if len(crew_members) > _VIRTUAL_ROWS:
+            self._render_window(self._win_first)
+            return
+        self._win_first = 0
+
+        # Build the target rows keyed by a stable per-object iid; dicts
+        # preserve insertion order, so this also records the row order
+        new_rows = {
+            str(id(crew)): (crew.name, crew.position, crew.department, crew.call_time_str)
+            for crew in crew_members
+        }
+
+        # Work out the scale of the change up front
+        to_delete = [iid for iid in rendered if iid not in new_rows]
+        order_changed = ([iid for iid in rendered if iid in new_rows] !=
+                         [iid for iid in new_rows if iid in rendered])
+        n_inserts = (len(new_rows) if order_changed
+                     else sum(1 for iid in new_rows if iid not in rendered))
+
+        # Freeze drawing during bulk mutation (Tk's closest equivalent of a
+        # Freeze/Thaw pair) so the widget repaints once instead of per row
+        bulk = len(to_delete) + n_inserts > 10
+        if bulk:
+            tree.configure(show="")
+        try:
+            # Hoist the bound methods so the row loops run on local
+            # variables instead of repeated attribute lookups
+            delete = tree.delete
+            insert = tree.insert
+            item = tree.item
+
+            # Remove rows whose objects are gone
+            for iid in to_delete:
+                delete(iid)
+                del rendered[iid]
+
+            # If surviving rows changed relative order, rebuild from scratch
+            if order_changed:
+                delete(*tree.get_children())
+                rendered.clear()
+
+            # Insert new rows and rewrite only rows whose values changed, so
+            # an add or edit costs O(1) Tcl calls instead of an O(N) rebuild
+            for index, (iid, values) in enumerate(new_rows.items()):
+                if iid not in rendered:
+                    insert("", index, iid=iid, values=values)
+                elif rendered[iid] != values:
+                    item(iid, values=values)
+        finally:
+            if bulk:
+                tree.configure(show="headings")
+
+        self._rendered = new_rows
+
+    def _render_window(self, first: int) -> None:
+        """Materialize only the window of rows starting at the given index"""
+        tree = self.crew_tree
+        total = len(self._visible_crew)
+        first = max(0, min(first, total - _VIRTUAL_WINDOW))
+        self._win_first = first
+
+        # Windows are small, so a frozen full rebuild beats diffing here
+        tree.configure(show="")
+        try:
+            tree.delete(*tree.get_children())
+            insert = tree.insert
+            # Track the materialized rows in _rendered so the diff path in
+            # update_list sees them if the list later drops back under the
+            # threshold, instead of inserting on top of stale window rows
+            new_rows = {}
+            for crew in self._visible_crew[first:first + _VIRTUAL_WINDOW]:
+                iid = str(id(crew))
+                values = (crew.name, crew.position, crew.department, crew.call_time_str)
+                new_rows[iid] = values
+                insert("", "end", iid=iid, values=values)
+        finally:
+            tree.configure(show="headings")
+        self._rendered = new_rows
+        self._set_vscroll()
+
+    def _set_vscroll(self) -> None:
+        """Point the scrollbar at the window's position in the full list"""
+        total = len(self._visible_crew)
+        lo, hi = self.crew_tree.yview()
+        n = min(_VIRTUAL_WINDOW, total)
+        first = self._win_first
+        self._vscrollbar.set((first + lo * n) / total, (first + hi * n) / total)
+
+    def _yview(self, *args) -> None:
+        """Scrollbar command; remapped onto the window when virtualized"""
+        total = len(self._visible_crew)
+        if total <= _VIRTUAL_ROWS:
+            self.crew_tree.yview(*args)
+            return
+        if args[0] == "moveto":
+            self._render_window(int(float(args[1]) * total))
+        else:  # ("scroll", n, "units" | "pages")
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= _VIRTUAL_WINDOW // 4
+            self._render_window(self._win_first + step)
+
+    def _on_tree_yscroll(self, lo, hi) -> None:
+        """yscrollcommand hook; slides the window when an edge is reached"""
+        total = len(self._visible_crew)
+        if total <= _VIRTUAL_ROWS:
+            self._vscrollbar.set(lo, hi)
+            return
+        if not self._win_shifting:
+            # Wheel scrolling inside the widget hit the window edge: slide
+            # the window half a step and keep the view in its middle
+            self._win_shifting = True
+            try:
+                if float(lo) <= 0.0 and self._win_first > 0:
+                    self._render_window(self._win_first - _VIRTUAL_WINDOW // 2)
+                    self.crew_tree.yview_moveto(0.5)
+                elif float(hi) >= 1.0 and self._win_first + _VIRTUAL_WINDOW < total:
+                    self._render_window(self._win_first + _VIRTUAL_WINDOW // 2)
+                    self.crew_tree.yview_moveto(0.5)
+            finally:
+                self._win_shifting = False
+        self._set_vscroll()
+
     def filter_by_department(self) -> None:
         """Filter crew list by selected department"""
+        # Debounce: rapid combobox navigation fires many selection events,
+        # so coalesce them into one list rebuild ~50 ms after the last one
+        if self._filter_after_id:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(50, self._do_filter)
+
+    def _do_filter(self) -> None:
+        """Apply the pending department filter"""
+        self._filter_after_id = None
+        # Re-selecting the department already shown is a no-op
+        if self.department_var.get() == self._last_filter:
+            return
         self.update_list()
     
     def add_department(self) -> None:
         """Add a new department"""
         dialog = DepartmentDialog(self, "Add Department")
         if dialog.result:
-            # Update department list
-            departments = self.call_sheet.get_departments()
-            if dialog.result not in departments:
-                self.department_combobox["values"] = self.department_combobox["values"] + (dialog.result,)
-            
+            # Append to the cached list and push it to Tcl once, instead of
+            # concatenating a fresh tuple through the combobox item
+            if dialog.result not in self._dept_list:
+                self._dept_list.append(dialog.result)
+                self.department_combobox.configure(values=self._dept_list)
+
             # Select new department
             self.department_var.set(dialog.result)
             self.filter_by_department()
     
+    def _get_dialog(self) -> "CrewMemberDialog":
+        """Return the shared dialog, building it on first use"""
+        if self._dialog is None:
+            self._dialog = CrewMemberDialog(self)
+        return self._dialog
+
     def add_crew_member(self) -> None:
         """Add a new crew member"""
         # Get current department selection
         department = self.department_var.get()
         if department == "All Departments":
             department = None
-        
-        dialog = CrewMemberDialog(self, "Add Crew Member", department=department)
-        if dialog.result:
-            self.call_sheet.add_crew_member(dialog.result)
+
+        result = self._get_dialog().show("Add Crew Member", department=department)
+        if result:
+            self.call_sheet.add_crew_member(result)
             self.update_departments()
             self.update_list()
     
@@ -716,21 +1170,19 @@ class CrewFrame(ttk.Frame):
         if not selected_item:
             messagebox.showerror("Edit Error", "No crew member selected.")
             return
-        
-        # Find selected crew member
-        selected_values = self.crew_tree.item(selected_item[0], "values")
-        selected_name = selected_values[0]
-        selected_department = selected_values[2]
-        
-        # Find crew member in call sheet
-        for i, crew_member in enumerate(self.call_sheet.crew_members):
-            if crew_member.name == selected_name and crew_member.department == selected_department:
-                dialog = CrewMemberDialog(self, "Edit Crew Member", crew_member=crew_member)
-                if dialog.result:
-                    self.call_sheet.crew_members[i] = dialog.result
-                    self.update_departments()
-                    self.update_list()
-                break
+
+        # The treeview iid is the crew object's id, so the index map
+        # resolves the selection directly
+        i = self._crew_index.get(selected_item[0])
+        if i is None:
+            return
+
+        crew_member = self.call_sheet.crew_members[i]
+        result = self._get_dialog().show("Edit Crew Member", crew_member)
+        if result:
+            self.call_sheet.replace_crew_member(i, result)
+            self.update_departments()
+            self.update_list()
     
     def remove_crew_member(self) -> None:
         """Remove selected crew member"""
@@ -738,54 +1190,46 @@ class CrewFrame(ttk.Frame):
         if not selected_item:
             messagebox.showerror("Remove Error", "No crew member selected.")
             return
-        
-        # Find selected crew member
-        selected_values = self.crew_tree.item(selected_item[0], "values")
-        selected_name = selected_values[0]
-        selected_department = selected_values[2]
-        
-        # Find crew member in call sheet
-        for i, crew_member in enumerate(self.call_sheet.crew_members):
-            if crew_member.name == selected_name and crew_member.department == selected_department:
-                if messagebox.askyesno("Remove Crew Member", "Are you sure you want to remove this crew member?"):
-                    self.call_sheet.crew_members.pop(i)
-                    self.update_departments()
-                    self.update_list()
-                break
+
+        # O(1) selection lookup, as in edit_crew_member
+        i = self._crew_index.get(selected_item[0])
+        if i is None:
+            return
+
+        if messagebox.askyesno("Remove Crew Member", "Are you sure you want to remove this crew member?"):
+            self.call_sheet.remove_crew_member(i)
+            self.update_departments()
+            self.update_list()
 
 class DepartmentDialog(tk.Toplevel):
     """Dialog for adding departments"""
     def __init__(self, parent, title):
         super().__init__(parent)
-        
+
         self.result = None
-        
+
         # Set dialog properties
         self.title(title)
         self.resizable(False, False)
         self.transient(parent)
         self.grab_set()
-        
+
         # Create and place widgets
         ttk.Label(self, text="Department Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.department_var = tk.StringVar()
         ttk.Entry(self, textvariable=self.department_var, width=30).grid(row=0, column=1, padx=5, pady=5, sticky="w")
-        
+
         # Button frame
         button_frame = ttk.Frame(self)
         button_frame.grid(row=1, column=0, columnspan=2, pady=10)
-        
+
         ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="OK", command=self.save).pack(side=tk.LEFT, padx=5)
-        
-        # Center dialog
-        self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (width // 2)
-        y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        
+
+        # Position near the parent from its cached geometry; no
+        # update_idletasks, so opening skips the forced synchronous relayout
+        self.geometry(f"+{parent.winfo_rootx() + 50}+{parent.winfo_rooty() + 50}")
+
         # Make dialog modal
         self.wait_window(self)
     
@@ -801,95 +1245,124 @@ class DepartmentDialog(tk.Toplevel):
         self.destroy()
 
 class CrewMemberDialog(tk.Toplevel):
-    """Dialog for adding/editing crew members"""
-    def __init__(self, parent, title, crew_member: Optional[CrewMember] = None, department: Optional[str] = None):
+    """Dialog for adding/editing crew members, built once and reused"""
+    def __init__(self, parent):
         super().__init__(parent)
-        
+
+        # Stay unmapped while widgets are built, as in CastMemberDialog
+        self.withdraw()
+
         self.result = None
-        
+
         # Set dialog properties
-        self.title(title)
         self.resizable(False, False)
         self.transient(parent)
-        self.grab_set()
-        
+
         # Create and place widgets
         ttk.Label(self, text="Name:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         self.name_var = tk.StringVar()
         ttk.Entry(self, textvariable=self.name_var, width=30).grid(row=0, column=1, padx=5, pady=5, sticky="w")
-        
+
         ttk.Label(self, text="Position:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         self.position_var = tk.StringVar()
         ttk.Entry(self, textvariable=self.position_var, width=30).grid(row=1, column=1, padx=5, pady=5, sticky="w")
-        
+
         ttk.Label(self, text="Department:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
         self.department_var = tk.StringVar()
         ttk.Entry(self, textvariable=self.department_var, width=30).grid(row=2, column=1, padx=5, pady=5, sticky="w")
-        
+
         ttk.Label(self, text="Call Time:").grid(row=3, column=0, padx=5, pady=5, sticky="w")
         self.call_time_input = TimeInput(self)
         self.call_time_input.grid(row=3, column=1, padx=5, pady=5, sticky="w")
-        
+
         ttk.Label(self, text="Notes:").grid(row=4, column=0, padx=5, pady=5, sticky="nw")
         self.notes_text = tk.Text(self, width=30, height=3)
         self.notes_text.grid(row=4, column=1, padx=5, pady=5, sticky="w")
-        
+
         # Button frame
         button_frame = ttk.Frame(self)
         button_frame.grid(row=5, column=0, columnspan=2, pady=10)
-        
-        ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="OK", command=self.save).pack(side=tk.LEFT, padx=5)
-        
-        # Set initial values if editing
-        if crew_member:
-            self.name_var.set(crew_member.name)
-            self.position_var.set(crew_member.position)
-            self.department_var.set(crew_member.department)
-            self.call_time_input.set_time(crew_member.call_time)
-            if crew_member.notes:
-                self.notes_text.insert("1.0", crew_member.notes)
-        elif department:
-            self.department_var.set(department)
-        
-        # Center dialog
+
+        ttk.Button(button_frame, text="Cancel", command=self.cancel).pack(side=tk.LEFT, padx=5)
+        self.ok_btn = ttk.Button(button_frame, text="OK", state="disabled", command=self.save)
+        self.ok_btn.pack(side=tk.LEFT, padx=5)
+
+        # Keep OK disabled until every required field is filled, so invalid
+        # saves can't happen and no error dialogs are ever raised
+        for var in (self.name_var, self.position_var, self.department_var):
+            var.trace_add("write", self._validate)
+
+        # Signals the modal wait in show() that the dialog was dismissed
+        self._done_var = tk.IntVar(self)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        # Center dialog once using the requested size
         self.update_idletasks()
-        width = self.winfo_width()
-        height = self.winfo_height()
+        width = self.winfo_reqwidth()
+        height = self.winfo_reqheight()
         x = (self.winfo_screenwidth() // 2) - (width // 2)
         y = (self.winfo_screenheight() // 2) - (height // 2)
-        self.geometry(f"{width}x{height}+{x}+{y}")
-        
-        # Make dialog modal
-        self.wait_window(self)
-    
+        self.geometry(f"+{x}+{y}")
+
+    def _validate(self, *_) -> None:
+        """Enable OK only while the required fields are non-empty"""
+        valid = (self.name_var.get() and self.position_var.get()
+                 and self.department_var.get())
+        self.ok_btn.configure(state="normal" if valid else "disabled")
+
+    def show(self, title: str, crew_member: Optional[CrewMember] = None,
+             department: Optional[str] = None) -> Optional[CrewMember]:
+        """Show the dialog modally and return the entered member, or None"""
+        self.result = None
+        self.title(title)
+
+        # Reset or prefill the fields
+        self.name_var.set(crew_member.name if crew_member else "")
+        self.position_var.set(crew_member.position if crew_member else "")
+        if crew_member:
+            self.department_var.set(crew_member.department)
+        else:
+            self.department_var.set(department or "")
+        self.call_time_input.set_time(
+            crew_member.call_time if crew_member else time(hour=8, minute=0))
+        self.notes_text.delete("1.0", tk.END)
+        if crew_member and crew_member.notes:
+            self.notes_text.insert("1.0", crew_member.notes)
+
+        # Reopening costs a deiconify instead of a widget-tree rebuild
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self._done_var)
+        return self.result
+
     def save(self) -> None:
         """Save dialog values and close"""
+        # The OK button is only enabled while all required fields are
+        # filled, so no per-field error dialogs are needed here
         name = self.name_var.get()
         position = self.position_var.get()
         department = self.department_var.get()
-        
-        if not name:
-            messagebox.showerror("Input Error", "Name is required.")
-            return
-        
-        if not position:
-            messagebox.showerror("Input Error", "Position is required.")
-            return
-        
-        if not department:
-            messagebox.showerror("Input Error", "Department is required.")
-            return
-        
+
         call_time = self.call_time_input.get_time()
-        notes = self.notes_text.get("1.0", tk.END).strip()
-        
+        # As in CastMemberDialog, "end-1c" skips the implicit newline
+        notes = self.notes_text.get("1.0", "end-1c")
+
         self.result = CrewMember(
             name=name,
             position=position,
             department=department,
             call_time=call_time,
-            notes=notes if notes else None
+            notes=notes.strip() or None if notes else None
         )
-        
-        self.destroy()
+
+        self._dismiss()
+
+    def cancel(self) -> None:
+        """Close the dialog without a result"""
+        self._dismiss()
+
+    def _dismiss(self) -> None:
+        """Hide the dialog and release the modal wait"""
+        self.grab_release()
+        self.withdraw()
+        self._done_var.set(self._done_var.get() + 1)
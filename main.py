@@ -1,10 +1,28 @@
 # main.py
+import functools
 import os
+import platform
+import subprocess
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import importlib.util
 
+# Resolve the open-with-default-viewer callable once at import; the
+# per-click path then makes no platform.system() calls at all
+_SYSTEM = platform.system()
+
+if _SYSTEM == 'Windows':
+    _open_file = os.startfile
+elif _SYSTEM == 'Darwin':  # macOS
+    def _open_file(path):
+        subprocess.Popen(['open', path], stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, close_fds=True)
+else:  # Linux
+    def _open_file(path):
+        subprocess.Popen(['xdg-open', path], stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL, close_fds=True)
+
 # Add the directory containing this script to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -14,16 +32,39 @@ REQUIRED_PACKAGES = [
     "pillow"
 ]
 
+# Stamp file written after a successful dependency check; its presence lets
+# later launches skip importing reportlab/PIL just to verify they exist
+DEPS_STAMP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", ".deps_ok")
+
+# pdf_generator (via reportlab) pulls in dozens of modules, so it is
+# imported on first PDF use instead of at startup
+_pdf = None
+
+def _load_pdf():
+    """Import pdf_generator once, on first use"""
+    global _pdf
+    if _pdf is None:
+        import pdf_generator
+        _pdf = pdf_generator
+    return _pdf
+
 # Replace the check_dependencies function in main.py with this:
 def check_dependencies():
     """
     Check if required packages are installed and warn if missing
     """
+    # Fast path: a stamp from a previous successful check on this Python
+    try:
+        with open(DEPS_STAMP) as f:
+            if f.read() == sys.version:
+                return True
+    except OSError:
+        pass
+
     try:
         # Try to import the packages directly, which is more reliable
         import reportlab
         import PIL  # Pillow will be available as PIL
-        return True
     except ImportError as e:
         missing_package = str(e).split("'")[-2]
         messagebox.showerror(
@@ -34,6 +75,78 @@ def check_dependencies():
         )
         return False
 
+    # Record the result; failure to write just means rechecking next launch
+    try:
+        os.makedirs(os.path.dirname(DEPS_STAMP), exist_ok=True)
+        with open(DEPS_STAMP, "w") as f:
+            f.write(sys.version)
+    except OSError:
+        pass
+    return True
+
+# The PDF callbacks live at module level and take the app explicitly, so
+# their code objects compile once and calls don't walk closure cells
+
+def _generate_pdf(app):
+    """Generate a PDF from the app's call sheet (bound as app.generate_pdf)"""
+    # Update call sheet from frames
+    app.production_frame.save_to_call_sheet()
+    app.locations_frame.save_to_call_sheet()
+
+    # Validate call sheet
+    if not app.call_sheet.production_name:
+        messagebox.showerror("PDF Error", "Production name is required.")
+        return
+
+    # Ask for filename
+    filename = filedialog.asksaveasfilename(
+        defaultextension=".pdf",
+        filetypes=[("PDF files", "*.pdf")],
+        initialdir="."
+    )
+
+    if not filename:
+        return
+
+    # Generate PDF
+    if _load_pdf().generate_call_sheet_pdf(app.call_sheet, filename):
+        messagebox.showinfo("Generate PDF", "Call sheet PDF generated successfully.")
+
+        # Ask if user wants to open the PDF
+        if messagebox.askyesno("Open PDF", "Do you want to open the generated PDF?"):
+            _open_file(filename)
+    else:
+        messagebox.showerror("PDF Error", "Failed to generate PDF.")
+
+def _preview_pdf(app):
+    """Preview the app's call sheet as a temporary PDF"""
+    # Update call sheet from frames
+    app.production_frame.save_to_call_sheet()
+    app.locations_frame.save_to_call_sheet()
+
+    # Validate call sheet
+    if not app.call_sheet.production_name:
+        messagebox.showerror("Preview Error", "Production name is required.")
+        return
+
+    # Preview call sheet
+    _load_pdf().preview_call_sheet(app.call_sheet)
+
+def batch_main():
+    """
+    Render every saved call sheet to a PDF in the current directory
+    """
+    from data_manager import load_all_call_sheets
+
+    sheets = load_all_call_sheets()
+    if not sheets:
+        print("No saved call sheets to render.")
+        return
+
+    jobs = [(cs, f"{cs.production_name or 'call_sheet'}.pdf") for cs in sheets]
+    results = _load_pdf().generate_call_sheets_bulk(jobs)
+    print(f"Generated {sum(results)} of {len(jobs)} PDFs.")
+
 def main():
     """
     Main entry point for the Call Sheet Generator application
@@ -41,80 +154,27 @@ def main():
     # Check dependencies
     if not check_dependencies():
         sys.exit(1)
-    
+
     # Create data directory if it doesn't exist
     os.makedirs("data", exist_ok=True)
-    
+
     # Create resources directory if it doesn't exist
     os.makedirs("resources", exist_ok=True)
-    
+
     try:
-        # Import application components
+        # Import application components; PDF machinery stays deferred so
+        # startup only pays for loading the GUI
         from gui import CallSheetApp
-        from pdf_generator import generate_call_sheet_pdf, preview_call_sheet
-        
+
         # Create the application
         app = CallSheetApp()
-        
-        # Connect PDF generation functionality
-        def new_generate_pdf():
-            # Update call sheet from frames
-            app.production_frame.save_to_call_sheet()
-            app.locations_frame.save_to_call_sheet()
-            
-            # Validate call sheet
-            if not app.call_sheet.production_name:
-                messagebox.showerror("PDF Error", "Production name is required.")
-                return
-            
-            # Ask for filename
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".pdf",
-                filetypes=[("PDF files", "*.pdf")],
-                initialdir="."
-            )
-            
-            if not filename:
-                return
-            
-            # Generate PDF
-            if generate_call_sheet_pdf(app.call_sheet, filename):
-                messagebox.showinfo("Generate PDF", "Call sheet PDF generated successfully.")
-                
-                # Ask if user wants to open the PDF
-                if messagebox.askyesno("Open PDF", "Do you want to open the generated PDF?"):
-                    import platform
-                    import subprocess
-                    
-                    # Open PDF with default viewer
-                    if platform.system() == 'Windows':
-                        os.startfile(filename)
-                    elif platform.system() == 'Darwin':  # macOS
-                        subprocess.call(['open', filename])
-                    else:  # Linux
-                        subprocess.call(['xdg-open', filename])
-            else:
-                messagebox.showerror("PDF Error", "Failed to generate PDF.")
-        
+
         # Replace the generate_pdf method
-        app.generate_pdf = new_generate_pdf
-        
-        # Add preview functionality
-        def preview_pdf():
-            # Update call sheet from frames
-            app.production_frame.save_to_call_sheet()
-            app.locations_frame.save_to_call_sheet()
-            
-            # Validate call sheet
-            if not app.call_sheet.production_name:
-                messagebox.showerror("Preview Error", "Production name is required.")
-                return
-            
-            # Preview call sheet
-            preview_call_sheet(app.call_sheet)
-        
+        app.generate_pdf = functools.partial(_generate_pdf, app)
+
         # Add preview button
-        ttk.Button(app.buttons_frame, text="Preview", command=preview_pdf).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(app.buttons_frame, text="Preview",
+                   command=functools.partial(_preview_pdf, app)).pack(side=tk.RIGHT, padx=5)
         
         # Run the application
         app.mainloop()
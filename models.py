@@ -1,30 +1,44 @@
 # models.py
+from bisect import insort
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, time
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     name: str
     address: str
     notes: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class CastMember:
     name: str
     role: str
     call_time: time
     notes: Optional[str] = None
+    # Cached "HH:MM" string so render loops read an attribute instead of
+    # calling strftime per row; edits replace members rather than mutating
+    # them, so computing once at construction is safe
+    call_time_str: str = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        self.call_time_str = f"{self.call_time.hour:02d}:{self.call_time.minute:02d}"
+
+@dataclass(slots=True)
 class CrewMember:
     name: str
     position: str
     department: str
     call_time: time
     notes: Optional[str] = None
+    # Cached "HH:MM" string, see CastMember.call_time_str
+    call_time_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.call_time_str = f"{self.call_time.hour:02d}:{self.call_time.minute:02d}"
 
-@dataclass
+@dataclass(slots=True)
 class CallSheet:
     production_name: str
     production_date: datetime
@@ -35,27 +49,72 @@ class CallSheet:
     cast_members: List[CastMember] = field(default_factory=list)
     crew_members: List[CrewMember] = field(default_factory=list)
     notes: Optional[str] = None
-    
+    # Incremental department -> crew index maintained by the crew mutators,
+    # plus the department names kept sorted as they come and go
+    _by_dept: Dict[str, List[CrewMember]] = field(
+        default_factory=lambda: defaultdict(list), init=False, repr=False, compare=False)
+    _dept_sorted: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Seed the index from any crew handed straight to the constructor
+        for crew in self.crew_members:
+            self._by_dept[crew.department].append(crew)
+        self._dept_sorted = sorted(self._by_dept)
+
     def add_filming_location(self, location: Location) -> bool:
         """Add a filming location if limit not reached"""
         if len(self.filming_locations) < 3:
             self.filming_locations.append(location)
             return True
         return False
-        
+
     def add_cast_member(self, cast_member: CastMember) -> None:
         """Add a cast member to the call sheet"""
         self.cast_members.append(cast_member)
-        
+
     def add_crew_member(self, crew_member: CrewMember) -> None:
         """Add a crew member to the call sheet"""
+        # A new department slots into the sorted list in place
+        if crew_member.department not in self._by_dept:
+            insort(self._dept_sorted, crew_member.department)
         self.crew_members.append(crew_member)
-        
+        self._by_dept[crew_member.department].append(crew_member)
+
+    def remove_crew_member(self, index: int) -> None:
+        """Remove the crew member at the given index"""
+        crew_member = self.crew_members.pop(index)
+        bucket = self._by_dept[crew_member.department]
+        bucket.remove(crew_member)
+        if not bucket:
+            # Last member of the department: drop it from both structures
+            del self._by_dept[crew_member.department]
+            self._dept_sorted.remove(crew_member.department)
+
+    def replace_crew_member(self, index: int, crew_member: CrewMember) -> None:
+        """Replace the crew member at the given index"""
+        old = self.crew_members[index]
+        self.crew_members[index] = crew_member
+        bucket = self._by_dept[old.department]
+        bucket.remove(old)
+        if not bucket:
+            del self._by_dept[old.department]
+            self._dept_sorted.remove(old.department)
+        if crew_member.department not in self._by_dept:
+            insort(self._dept_sorted, crew_member.department)
+        self._by_dept[crew_member.department].append(crew_member)
+
     def get_departments(self) -> List[str]:
         """Get a list of all departments"""
-        departments = set(crew.department for crew in self.crew_members)
-        return sorted(list(departments))
-        
+        # The mutators keep this sorted, so reading it is free
+        return self._dept_sorted
+
     def get_crew_by_department(self, department: str) -> List[CrewMember]:
         """Get all crew members in a specific department"""
-        return [crew for crew in self.crew_members if crew.department == department]
+        # O(1) bucket lookup against the maintained index
+        return self._by_dept.get(department, [])
+
+    def get_crew_by_department_all(self) -> Dict[str, List[CrewMember]]:
+        """Get crew grouped by department, in sorted department order"""
+        # Served straight off the maintained index; callers that walk every
+        # department get the whole grouping in one call
+        return {d: self._by_dept[d] for d in self._dept_sorted}
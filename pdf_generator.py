@@ -1,15 +1,132 @@
 # pdf_generator.py
+import io
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate
+from reportlab.platypus import Paragraph, Spacer, Table, TableStyle, Image
 from reportlab.platypus import PageBreak, ListFlowable, ListItem
 
 from models import CallSheet, Location, CastMember, CrewMember
 
+# Module logger; NullHandler keeps error paths free of stdout I/O unless
+# the embedding application configures logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# User-supplied text gets escaped before interpolation into Paragraph
+# markup; the cache amortizes repeats, since the same names show up in
+# both the tables and the notes sections
+_ESC = lru_cache(maxsize=4096)(escape)
+
+# C-level sort key shared by the cast and crew sorts
+_CALL_TIME_KEY = attrgetter('call_time')
+
+# Productions reuse one logo across many sheets; caching the decoded image
+# by (path, mtime) skips the open-and-decode on every build after the first
+@lru_cache(maxsize=32)
+def _logo_reader(path: str, mtime: float):
+    """Return a cached ImageReader holding the decoded logo"""
+    from reportlab.lib.utils import ImageReader
+    return ImageReader(path)
+
+def _warm_fonts() -> None:
+    """Populate metric tables for the built-in fonts the styles use"""
+    # getFont fills ReportLab's lazy per-process metrics cache; running it
+    # here (and as the bulk pool initializer) keeps the first build from
+    # paying for the font search
+    pdfmetrics.getFont('Helvetica')
+    pdfmetrics.getFont('Helvetica-Bold')
+
+_warm_fonts()
+
+# Color constants bound once instead of attribute lookups on the colors
+# module at every use
+_LIGHTGREY, _BLACK, _WHITE = colors.lightgrey, colors.black, colors.white
+
+# Styles and table styles are immutable once configured, so build them once
+# at import instead of per generate_call_sheet_pdf call
+_STYLES = getSampleStyleSheet()
+
+_STYLES['Title'].fontSize = 16
+_STYLES['Title'].spaceAfter = 12
+
+_STYLES['Heading2'].fontSize = 14
+_STYLES['Heading2'].spaceAfter = 6
+
+_STYLES['Heading3'].fontSize = 12
+_STYLES['Heading3'].spaceAfter = 6
+
+_STYLES['Normal'].fontSize = 10
+_STYLES['Normal'].spaceAfter = 6
+
+if 'BoldText' not in _STYLES:
+    _STYLES.add(ParagraphStyle(
+        name='BoldText',  # Changed from 'Bold' to avoid potential conflicts
+        parent=_STYLES['Normal'],
+        fontName='Helvetica-Bold',
+        fontSize=10
+    ))
+
+# The cast and crew tables share one header/body treatment
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), _LIGHTGREY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), _BLACK),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    # Body background, text color and alignment match ReportLab's defaults
+    # (white, black, left), so no commands are issued for them; that keeps
+    # the emitted content stream free of no-op fill rectangles
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+    ('GRID', (0, 0), (-1, -1), 0.5, _BLACK)
+])
+
+# Spacers are stateless fixed-size flowables, so the two sizes the layout
+# uses are shared instances instead of fresh objects per section
+_SPACER_SM = Spacer(1, 0.1*inch)
+_SPACER_MD = Spacer(1, 0.25*inch)
+
+# Static section labels pre-parsed once; Paragraphs are read-only during a
+# build, so sharing them across documents skips the mini-XML parse per PDF
+_P_LOCATIONS = Paragraph("<b>FILMING LOCATIONS:</b>", _STYLES['Heading3'])
+_P_CAST = Paragraph("<b>CAST:</b>", _STYLES['Heading2'])
+_P_CAST_NOTES = Paragraph("<b>CAST NOTES:</b>", _STYLES['Heading3'])
+_P_CREW = Paragraph("<b>CREW:</b>", _STYLES['Heading2'])
+_P_CREW_NOTES = Paragraph("<b>CREW NOTES:</b>", _STYLES['Heading3'])
+_P_PRODUCTION_NOTES = Paragraph("<b>PRODUCTION NOTES:</b>", _STYLES['Heading3'])
+
+# The frame and page template carry no per-document state, so one shared
+# instance serves every document this process builds
+_FRAME = Frame(0.5*inch, 0.5*inch, letter[0] - 1*inch, letter[1] - 1*inch, id='normal')
+_PAGE_TEMPLATE = PageTemplate(id='cs', frames=[_FRAME])
+
+def _make_doc(output_path) -> BaseDocTemplate:
+    """Build a document around the shared page template"""
+    doc = BaseDocTemplate(
+        output_path,
+        pagesize=letter,
+        rightMargin=0.5*inch,
+        leftMargin=0.5*inch,
+        topMargin=0.5*inch,
+        bottomMargin=0.5*inch
+    )
+    doc.addPageTemplates([_PAGE_TEMPLATE])
+    return doc
+
 def generate_call_sheet_pdf(call_sheet: CallSheet, output_path: str) -> bool:
     """
     Generate a PDF call sheet from a CallSheet object
@@ -22,204 +139,194 @@ def generate_call_sheet_pdf(call_sheet: CallSheet, output_path: str) -> bool:
         bool: True if PDF generation was successful, False otherwise
     """
     try:
-        # Create document
-        doc = SimpleDocTemplate(
-            output_path,
-            pagesize=letter,
-            rightMargin=0.5*inch,
-            leftMargin=0.5*inch,
-            topMargin=0.5*inch,
-            bottomMargin=0.5*inch
-        )
-        
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Modify existing styles instead of creating new ones with the same name
-        styles['Title'].fontSize = 16
-        styles['Title'].spaceAfter = 12
-        
-        styles['Heading2'].fontSize = 14
-        styles['Heading2'].spaceAfter = 6
-        
-        styles['Heading3'].fontSize = 12
-        styles['Heading3'].spaceAfter = 6
-        
-        styles['Normal'].fontSize = 10
-        styles['Normal'].spaceAfter = 6
-        
-        # Add new styles with unique names
-        styles.add(ParagraphStyle(
-            name='BoldText',  # Changed from 'Bold' to avoid potential conflicts
-            parent=styles['Normal'],
-            fontName='Helvetica-Bold',
-            fontSize=10
-        ))
-        
+        # Build into memory; the finished bytes are published atomically
+        # below instead of streaming small writes straight to disk
+        buf = io.BytesIO()
+        doc = _make_doc(buf)
+
+
+        # Get the shared, preconfigured styles
+        styles = _STYLES
+
         # Start building document content
         story = []
         
         # Add logo if available
         if call_sheet.logo_path and os.path.exists(call_sheet.logo_path):
             try:
-                img = Image(call_sheet.logo_path, width=1.5*inch, height=1*inch)
+                reader = _logo_reader(call_sheet.logo_path,
+                                      os.path.getmtime(call_sheet.logo_path))
+                img = Image(reader, width=1.5*inch, height=1*inch)
                 img.hAlign = 'RIGHT'
-                story.append(img)
-                story.append(Spacer(1, 0.25*inch))
+                story += [img, _SPACER_MD]
             except Exception as e:
-                print(f"Error loading logo: {e}")
+                log.warning("Error loading logo: %s", e)
         
         # Add title
         production_date_str = call_sheet.production_date.strftime("%A, %B %d, %Y")
-        title_text = f"<b>{call_sheet.production_name.upper()}</b><br/><b>CALL SHEET - {production_date_str}</b>"
-        story.append(Paragraph(title_text, styles['Title']))
-        story.append(Spacer(1, 0.25*inch))
+        title_text = f"<b>{_ESC(call_sheet.production_name.upper())}</b><br/><b>CALL SHEET - {production_date_str}</b>"
+        story += [Paragraph(title_text, styles['Title']), _SPACER_MD]
         
+        # Format each distinct call time once up front; most of a crew
+        # shares a handful of slots, so this collapses the strftime calls
+        # from one per row to one per unique time
+        all_times = ({m.call_time for m in call_sheet.cast_members}
+                     | {m.call_time for m in call_sheet.crew_members})
+        all_times.add(call_sheet.general_call_time)
+        fmt = {t: t.strftime("%I:%M %p") for t in all_times}
+
         # Add general call time
-        call_time_text = f"<b>GENERAL CALL TIME: {call_sheet.general_call_time.strftime('%I:%M %p')}</b>"
-        story.append(Paragraph(call_time_text, styles['Heading3']))
-        story.append(Spacer(1, 0.1*inch))
+        call_time_text = f"<b>GENERAL CALL TIME: {fmt[call_sheet.general_call_time]}</b>"
+        story += [Paragraph(call_time_text, styles['Heading3']), _SPACER_SM]
         
         # Add home base
         if call_sheet.home_base:
-            home_base_text = f"<b>HOME BASE:</b><br/>{call_sheet.home_base.name}<br/>{call_sheet.home_base.address}"
+            home_base_text = f"<b>HOME BASE:</b><br/>{_ESC(call_sheet.home_base.name)}<br/>{_ESC(call_sheet.home_base.address)}"
             if call_sheet.home_base.notes:
-                home_base_text += f"<br/><i>Notes: {call_sheet.home_base.notes}</i>"
-            story.append(Paragraph(home_base_text, styles['Normal']))
-            story.append(Spacer(1, 0.25*inch))
+                home_base_text += f"<br/><i>Notes: {_ESC(call_sheet.home_base.notes)}</i>"
+            story += [Paragraph(home_base_text, styles['Normal']), _SPACER_MD]
         
         # Add filming locations
         if call_sheet.filming_locations:
-            story.append(Paragraph("<b>FILMING LOCATIONS:</b>", styles['Heading3']))
-            
+            # Accumulate the section locally, then splice it in with one
+            # extend instead of per-flowable appends
+            section = [_P_LOCATIONS]
             for i, location in enumerate(call_sheet.filming_locations, 1):
-                loc_text = f"<b>Location {i}: {location.name}</b><br/>{location.address}"
+                loc_text = f"<b>Location {i}: {_ESC(location.name)}</b><br/>{_ESC(location.address)}"
                 if location.notes:
-                    loc_text += f"<br/><i>Notes: {location.notes}</i>"
-                story.append(Paragraph(loc_text, styles['Normal']))
-            
-            story.append(Spacer(1, 0.25*inch))
+                    loc_text += f"<br/><i>Notes: {_ESC(location.notes)}</i>"
+                section.append(Paragraph(loc_text, styles['Normal']))
+            section.append(_SPACER_MD)
+            story += section
         
         # Add cast list
         if call_sheet.cast_members:
-            story.append(Paragraph("<b>CAST:</b>", styles['Heading2']))
-            
-            # Create table for cast
-            cast_data = [["Name", "Role", "Call Time"]]
-            
             # Sort cast by call time
-            sorted_cast = sorted(call_sheet.cast_members, key=lambda x: x.call_time)
-            
-            for cast in sorted_cast:
-                cast_data.append([
-                    cast.name,
-                    cast.role,
-                    cast.call_time.strftime("%I:%M %p")
-                ])
+            sorted_cast = sorted(call_sheet.cast_members, key=_CALL_TIME_KEY)
+
+            # Preallocate the row list and fill by index; tuple rows are
+            # accepted by Table and skip append's resize-and-copy growth
+            cast_data = [None] * (len(sorted_cast) + 1)
+            cast_data[0] = ("Name", "Role", "Call Time")
+            for i, cast in enumerate(sorted_cast, 1):
+                cast_data[i] = (cast.name, cast.role, fmt[cast.call_time])
             
-            # Create table with style
+            # Create table with the shared style
             cast_table = Table(cast_data, colWidths=[2.5*inch, 2.5*inch, 1*inch])
-            cast_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
-            ]))
-            
-            story.append(cast_table)
-            story.append(Spacer(1, 0.25*inch))
+            cast_table.setStyle(_TABLE_STYLE)
+
+            story += [_P_CAST, cast_table, _SPACER_MD]
             
             # Add cast notes
             cast_with_notes = [c for c in call_sheet.cast_members if c.notes]
             if cast_with_notes:
-                story.append(Paragraph("<b>CAST NOTES:</b>", styles['Heading3']))
-                
-                for cast in cast_with_notes:
-                    note_text = f"<b>{cast.name} ({cast.role}):</b> {cast.notes}"
-                    story.append(Paragraph(note_text, styles['Normal']))
-                
-                story.append(Spacer(1, 0.25*inch))
+                # One br-joined Paragraph instead of a flowable per person:
+                # a single XML parse and wrap pass for the whole section
+                notes_html = "<br/><br/>".join(
+                    f"<b>{_ESC(c.name)} ({_ESC(c.role)}):</b> {_ESC(c.notes)}"
+                    for c in cast_with_notes
+                )
+                story += [_P_CAST_NOTES,
+                          Paragraph(notes_html, styles['Normal']),
+                          _SPACER_MD]
         
         # Add crew list
         if call_sheet.crew_members:
-            story.append(Paragraph("<b>CREW:</b>", styles['Heading2']))
-            
-            # Group crew by department
-            departments = call_sheet.get_departments()
-            
-            for department in departments:
-                story.append(Paragraph(f"<b>{department.upper()}</b>", styles['Heading3']))
-                
-                # Create table for this department
-                crew_data = [["Name", "Position", "Call Time"]]
-                
-                # Get crew in this department and sort by call time
-                dept_crew = sorted(
-                    call_sheet.get_crew_by_department(department),
-                    key=lambda x: x.call_time
-                )
-                
+            # One flattened table with a spanned header row per department,
+            # instead of a heading paragraph plus table per department;
+            # ReportLab then runs a single wrap/layout pass over the crew
+            # Total row count is known up front: one table header, one
+            # header row per department, one row per crew member
+            grouped = call_sheet.get_crew_by_department_all()
+            crew_data = [None] * (1 + len(grouped) + len(call_sheet.crew_members))
+            crew_data[0] = ("Name", "Position", "Call Time")
+            header_rows = []
+            row = 1
+
+            for department, members in grouped.items():
+                header_rows.append(row)
+                crew_data[row] = (department.upper(), "", "")
+                row += 1
+
+                # Sort this department's crew by call time
+                dept_crew = sorted(members, key=_CALL_TIME_KEY)
+
                 for crew in dept_crew:
-                    crew_data.append([
-                        crew.name,
-                        crew.position,
-                        crew.call_time.strftime("%I:%M %p")
-                    ])
-                
-                # Create table with style
-                crew_table = Table(crew_data, colWidths=[2*inch, 3*inch, 1*inch])
-                crew_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-                    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-                    ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-                    ('ALIGN', (0, 1), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 1), (-1, -1), 10),
-                    ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 0.5, colors.black)
-                ]))
-                
-                story.append(crew_table)
-                story.append(Spacer(1, 0.25*inch))
-            
+                    crew_data[row] = (crew.name, crew.position, fmt[crew.call_time])
+                    row += 1
+
+            # Shared commands plus the span/background treatment per header row
+            crew_table = Table(crew_data, colWidths=[2*inch, 3*inch, 1*inch])
+            crew_table.setStyle(TableStyle(_TABLE_STYLE.getCommands() + [
+                cmd for r in header_rows for cmd in (
+                    ('SPAN', (0, r), (-1, r)),
+                    ('BACKGROUND', (0, r), (-1, r), _LIGHTGREY),
+                    ('FONTNAME', (0, r), (-1, r), 'Helvetica-Bold'),
+                )
+            ]))
+
+            story += [_P_CREW, crew_table, _SPACER_MD]
+
             # Add crew notes
             crew_with_notes = [c for c in call_sheet.crew_members if c.notes]
             if crew_with_notes:
-                story.append(Paragraph("<b>CREW NOTES:</b>", styles['Heading3']))
-                
-                for crew in crew_with_notes:
-                    note_text = f"<b>{crew.name} ({crew.position}):</b> {crew.notes}"
-                    story.append(Paragraph(note_text, styles['Normal']))
-                
-                story.append(Spacer(1, 0.25*inch))
+                # As with cast notes: one joined Paragraph for the section
+                notes_html = "<br/><br/>".join(
+                    f"<b>{_ESC(c.name)} ({_ESC(c.position)}):</b> {_ESC(c.notes)}"
+                    for c in crew_with_notes
+                )
+                story += [_P_CREW_NOTES,
+                          Paragraph(notes_html, styles['Normal']),
+                          _SPACER_MD]
         
         # Add general notes
         if call_sheet.notes:
-            story.append(Paragraph("<b>PRODUCTION NOTES:</b>", styles['Heading3']))
-            story.append(Paragraph(call_sheet.notes, styles['Normal']))
+            story += [_P_PRODUCTION_NOTES, Paragraph(_ESC(call_sheet.notes), styles['Normal'])]
         
         # Build PDF
         doc.build(story)
-        
+
+        # One large write, then an atomic rename so readers never see a
+        # partial PDF at output_path
+        tmp_path = output_path + ".part"
+        with open(tmp_path, "wb") as f:
+            f.write(buf.getvalue())
+        os.replace(tmp_path, output_path)
+
         return True
-    except Exception as e:
-        print(f"Error generating PDF: {e}")
+    except Exception:
+        log.exception("Error generating PDF")
         return False
 
+def _generate_one(job: Tuple[CallSheet, str]) -> bool:
+    """Unpack one bulk job; module-level so the process pool can pickle it"""
+    call_sheet, output_path = job
+    return generate_call_sheet_pdf(call_sheet, output_path)
+
+def generate_call_sheets_bulk(sheets: List[Tuple[CallSheet, str]],
+                              workers: Optional[int] = None) -> List[bool]:
+    """
+    Generate PDFs for many call sheets in parallel
+
+    Each ReportLab build is CPU-bound, so a process pool scales with
+    physical cores where sequential generation cannot.
+
+    Args:
+        sheets: (call_sheet, output_path) pairs to render
+        workers: Pool size; defaults to the machine's CPU count
+
+    Returns:
+        list[bool]: Per-sheet success flags, in input order
+    """
+    if not sheets:
+        return []
+
+    # Workers pay the ReportLab import (and its style setup above) once
+    # when the module loads, then render sheets back to back
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             initializer=_warm_fonts) as executor:
+        return list(executor.map(_generate_one, sheets))
+
 def preview_call_sheet(call_sheet: CallSheet) -> None:
     """
     Generate a temporary PDF preview of the call sheet and open it
@@ -232,20 +339,28 @@ def preview_call_sheet(call_sheet: CallSheet) -> None:
     import subprocess
     import platform
     
-    # Create temporary file
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_file:
-        temp_path = temp_file.name
+    # Create temporary file; mkstemp hands back a bare fd instead of the
+    # wrapper object (and its weakref finalizer) NamedTemporaryFile builds
+    fd, temp_path = tempfile.mkstemp(suffix='.pdf')
+    os.close(fd)
     
     # Generate PDF
     success = generate_call_sheet_pdf(call_sheet, temp_path)
     
     if success:
-        # Open PDF with default viewer
+        # Batch or headless runs can suppress the viewer entirely
+        if os.environ.get('CALLSHEET_NO_OPEN'):
+            return
+
+        # Open PDF with default viewer, detached so this returns
+        # immediately instead of waiting on the viewer process
         if platform.system() == 'Windows':
             os.startfile(temp_path)
         elif platform.system() == 'Darwin':  # macOS
-            subprocess.call(['open', temp_path])
+            subprocess.Popen(['open', temp_path], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
         else:  # Linux
-            subprocess.call(['xdg-open', temp_path])
+            subprocess.Popen(['xdg-open', temp_path], stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, start_new_session=True)
     else:
         print("Failed to generate PDF preview.")
@@ -13,6 +13,7 @@ setup(
     entry_points={
         'console_scripts': [
             'callsheet=main:main',
+            'callsheet-batch=main:batch_main',
         ],
     },
 )